@@ -9,26 +9,138 @@ Author: Claude AI System
 Date: May 2025
 """
 
-import math
-from typing import Tuple, Optional, List
+from math import ceil as _ceil, copysign as _copysign, log as _log, sqrt as _sqrt
+from typing import Tuple, Optional
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+
+def _precompute_catalan(count: int) -> Tuple[int, ...]:
+    """
+    Build the first `count` Catalan numbers at import time
+
+    Uses the recurrence C(n+1) = C(n) * (4n+2) // (n+2), so the whole
+    table costs one multiply and one divide per entry.
+
+    Args:
+        count: How many numbers to generate (C(0) .. C(count-1))
+
+    Returns:
+        Tuple with the precomputed Catalan numbers
+    """
+    numbers = [1]
+    for n in range(count - 1):
+        numbers.append(numbers[-1] * (4 * n + 2) // (n + 2))
+    return tuple(numbers)
+
+
+def _catalan_series_kernel(A: float, tol: float, max_terms: int) -> Tuple[float, int, float]:
+    """
+    Evaluate the Catalan series sum C(n) * A^n until convergence
+
+    Pure scalar arithmetic so Numba can compile it to native code when
+    available. The Catalan recurrence is carried in float64, which is exact
+    up to C(33) and more than enough precision for the convergent range
+    |A| <= 1/4, where fewer than 40 terms are ever needed.
+
+    Args:
+        A: Series parameter ac/b²
+        tol: Desired precision for the truncation error
+        max_terms: Maximum number of terms to accumulate
+
+    Returns:
+        Tuple with (series value, number of terms used, residual estimate)
+    """
+    # Near the convergence boundary the series tail decays slowly, so switch
+    # to Newton iteration on the transformed equation A·u² - u + 1 = 0:
+    # u_{k+1} = (1 - A·u²) / (1 - 2A·u) doubles the correct digits per step
+    # and reaches machine precision in a handful of iterations regardless
+    # of A. The plain series stays in charge for small |A|, where it needs
+    # only a few terms anyway.
+    if abs(A) > 0.1:
+        u = 1.0 + A  # first two series terms as the starting guess
+        delta = abs(A)
+        for k in range(max_terms):
+            denominator = 1.0 - 2.0 * A * u
+            if denominator == 0.0:
+                break
+            u_new = (1.0 - A * u * u) / denominator
+            delta = abs(u_new - u)
+            u = u_new
+            if delta < tol:
+                return u, k + 1, delta
+        return u, max_terms, delta
+
+    # Closed-form trip count: |C(n)*A^n| <= (4|A|)^n, so (4|A|)^N < tol
+    # gives the number of terms directly and the loops below run branchless
+    q = 4.0 * abs(A)
+    if q <= 0.0:
+        n_terms = 1
+    elif q >= 1.0:
+        n_terms = max_terms
+    else:
+        n_estimate = int(_ceil(_log(tol) / _log(q)))
+        n_terms = min(max_terms, max(1, n_estimate))
+
+    # Forward pass: record the coefficients and the final-term residual
+    coeffs = np.empty(n_terms)
+    a_pow = 1.0
+    catalan = 1.0
+    term = 1.0
+
+    for n in range(n_terms):
+        coeffs[n] = catalan
+        term = catalan * a_pow
+
+        # Advance A^n and C(n) via the recurrence C(n+1) = C(n)*(4n+2)/(n+2)
+        a_pow *= A
+        catalan = catalan * (4.0 * n + 2.0) / (n + 2.0)
+
+    # Horner evaluation from the highest term inward: one multiply-add per
+    # term, with the accumulator kept near unit magnitude for better rounding
+    u_series = 0.0
+    for n in range(n_terms - 1, -1, -1):
+        u_series = u_series * A + coeffs[n]
+
+    return u_series, n_terms, abs(term)
+
+
+# JIT-compile the kernel when Numba is available (optional dependency)
+try:
+    from numba import njit
+    _catalan_series_kernel = njit(cache=True, fastmath=True)(_catalan_series_kernel)
+except ImportError:
+    pass
+
+
+@dataclass(frozen=True)
 class QuadraticEquation:
-    """Represents a quadratic equation ax² + bx + c = 0"""
+    """Represents a quadratic equation ax² + bx + c = 0
+
+    Frozen and slotted: instances carry no __dict__, attribute reads go
+    through slot offsets, and equations are hashable (usable as cache keys).
+    __slots__ is declared by hand because dataclass(slots=True) requires
+    Python 3.10 and the CI matrix still covers 3.8/3.9.
+    """
+    __slots__ = ('a', 'b', 'c')
+
     a: float
-    b: float 
+    b: float
     c: float
-    
+
     def __str__(self) -> str:
         return f"{self.a}x² + {self.b}x + {self.c} = 0"
 
 
 @dataclass
 class Solution:
-    """Stores the solution results"""
-    roots: List[float]
+    """Stores the solution results
+
+    No __slots__ here: the defaulted fields would clash with a manual
+    declaration, and dataclass(slots=True) needs Python 3.10.
+    """
+    roots: Tuple[float, ...]
     method_used: str
     terms_used: Optional[int] = None
     error: Optional[float] = None
@@ -51,29 +163,33 @@ class CatalanSolver:
             tolerance: Desired precision for series convergence
         """
         self.tolerance = tolerance
+        # Solve results keyed on (a, b, c); tolerance is fixed per instance
+        self._cache = {}
     
     @staticmethod
     def catalan_number(n: int) -> int:
         """
         Calculate the nth Catalan number using optimized formula
-        
+
         Args:
             n: Catalan number index (n >= 0)
-            
+
         Returns:
             The nth Catalan number
-            
+
         Formula: C(n) = (2n)! / ((n+1)! * n!)
         """
-        if n == 0:
-            return 1
-        
-        # Efficient calculation avoiding overflow
-        result = 1
-        for i in range(n):
-            result = result * (2 * n - i) // (i + 1)
-        
-        return result // (n + 1)
+        # Fast path: indices covered by the precomputed table
+        if n < len(CATALAN_NUMBERS):
+            return CATALAN_NUMBERS[n]
+
+        # Beyond the table: continue the recurrence from the last cached
+        # entry instead of recomputing from C(0)
+        result = CATALAN_NUMBERS[-1]
+        for k in range(len(CATALAN_NUMBERS) - 1, n):
+            result = result * (4 * k + 2) // (k + 2)
+
+        return result
     
     def _is_zero(self, value: float) -> bool:
         """Check if a value is numerically zero"""
@@ -84,120 +200,109 @@ class CatalanSolver:
         if self._is_zero(equation.b):
             # Case 0x + c = 0
             if self._is_zero(equation.c):
-                return Solution([], "Infinite solutions")
+                return Solution((), "Infinite solutions")
             else:
-                return Solution([], "No solution")
+                return Solution((), "No solution")
         
         root = -equation.c / equation.b
-        return Solution([root], "Linear")
+        return Solution((root,), "Linear")
     
     def _solve_missing_c(self, equation: QuadraticEquation) -> Solution:
         """Solve ax² + bx = 0 (c = 0)"""
         root1 = 0.0
         root2 = -equation.b / equation.a
-        return Solution([root1, root2], "Factorization (c=0)")
+        return Solution((root1, root2), "Factorization (c=0)")
     
     def _solve_missing_b(self, equation: QuadraticEquation) -> Solution:
         """Solve ax² + c = 0 (b = 0)"""
         discriminant = -equation.c / equation.a
         
         if discriminant < 0:
-            return Solution([], "No real solutions")
+            return Solution((), "No real solutions")
         
-        sqrt_disc = math.sqrt(discriminant)
-        return Solution([sqrt_disc, -sqrt_disc], "Direct root (b=0)")
+        sqrt_disc = _sqrt(discriminant)
+        return Solution((sqrt_disc, -sqrt_disc), "Direct root (b=0)")
     
-    def _solve_standard_formula(self, equation: QuadraticEquation) -> Solution:
-        """Solve using standard quadratic formula"""
-        discriminant = equation.b**2 - 4*equation.a*equation.c
-        
+    def _solve_standard_formula(self, equation: QuadraticEquation,
+                                discriminant: Optional[float] = None) -> Solution:
+        """Solve using standard quadratic formula
+
+        Args:
+            equation: Equation to be solved
+            discriminant: b² - 4ac when the caller already has it, to avoid
+                recomputing b² on the dispatch path
+        """
+        # Bind to locals: LOAD_FAST beats repeated attribute lookups,
+        # and b*b avoids the BINARY_POWER dispatch of b**2
+        a, b, c = equation.a, equation.b, equation.c
+        if discriminant is None:
+            discriminant = b * b - 4 * a * c
+
         if discriminant < 0:
-            return Solution([], "No real solutions")
-        
-        sqrt_disc = math.sqrt(discriminant)
-        denominator = 2 * equation.a
-        
-        root1 = (-equation.b + sqrt_disc) / denominator
-        root2 = (-equation.b - sqrt_disc) / denominator
-        
-        return Solution([root1, root2], "Quadratic formula")
-    
-    def _compute_catalan_parameter(self, equation: QuadraticEquation) -> float:
-        """Calculate parameter A = ac/b² for Catalan method"""
-        return (equation.a * equation.c) / (equation.b**2)
-    
+            return Solution((), "No real solutions")
+
+        sqrt_disc = _sqrt(discriminant)
+
+        # Citardauq form: compute the larger-magnitude root first so -b and
+        # ±√D never cancel, then recover the other from Vieta's x₁x₂ = c/a
+        # (the same relation the Catalan path already uses)
+        q = -0.5 * (b + _copysign(sqrt_disc, b))
+        root1 = q / a
+        root2 = c / q if q != 0 else -b / a
+
+        return Solution((root1, root2), "Quadratic formula")
+
     def _compute_exact_u(self, A: float) -> float:
-        """Calculate exact solution u = (1 - √(1-4A))/(2A)"""
+        """Calculate exact solution u = (1 - √(1-4A))/(2A)
+
+        Only valid for |A| ≤ 1/4 (so 1-4A ≥ 0), which the threshold check
+        in solve() guarantees before any Catalan-path code runs.
+        """
         if self._is_zero(A):
             return 1.0  # Limit when A → 0
-        
-        discriminant = 1 - 4*A
-        if discriminant < 0:
-            raise ValueError("Negative discriminant in transformation")
-        
-        return (1 - math.sqrt(discriminant)) / (2*A)
+
+        return (1 - _sqrt(1 - 4*A)) / (2*A)
     
-    def _compute_catalan_series(self, A: float, u_exact: float) -> Tuple[float, int]:
+    def _compute_catalan_series(self, A: float) -> Tuple[float, int, float]:
         """
         Calculate Catalan series until convergence
-        
+
+        Convergence is tested against the magnitude of the last term: since
+        C(n)*A^n is bounded by (4|A|)^n, the remaining tail is geometric and
+        a term below tolerance * (1 - 4|A|) bounds the total truncation error
+        by the tolerance. No closed-form reference solution is needed.
+
+        The actual loop lives in _catalan_series_kernel, a free function
+        that Numba JIT-compiles when available.
+
         Returns:
-            Tuple with (series value, number of terms used)
+            Tuple with (series value, number of terms used, residual estimate)
         """
-        u_series = 0.0
-        n = 0
-        
-        while n < self.MAX_TERMS:
-            # Calculate current term: C(n) * A^n
-            catalan_n = self.catalan_number(n)
-            term = catalan_n * (A ** n)
-            u_series += term
-            
-            # Check convergence
-            error = abs(u_series - u_exact)
-            if error < self.tolerance:
-                return u_series, n + 1
-            
-            n += 1
-        
-        # If doesn't converge, return best approximation
-        return u_series, self.MAX_TERMS
+        return _catalan_series_kernel(A, self.tolerance, self.MAX_TERMS)
     
-    def _solve_catalan_method(self, equation: QuadraticEquation) -> Solution:
-        """Solve using Catalan numbers method"""
-        # Calculate parameter A
-        A = self._compute_catalan_parameter(equation)
-        
-        # Check if method is applicable
-        if abs(A) > self.CATALAN_THRESHOLD:
-            return self._solve_standard_formula(equation)
-        
-        try:
-            # Calculate exact solution for comparison
-            u_exact = self._compute_exact_u(A)
-            
-            # Approximate by Catalan series
-            u_series, terms_used = self._compute_catalan_series(A, u_exact)
-            
-            # Convert back to x: x = -(c/b) * u
-            x1 = -(equation.c / equation.b) * u_series
-            
-            # Second root by Vieta's relation: x₁*x₂ = c/a
-            x2 = equation.c / (equation.a * x1)
-            
-            # Calculate final error
-            final_error = abs(u_series - u_exact)
-            
-            return Solution(
-                roots=[x1, x2],
-                method_used="Catalan series",
-                terms_used=terms_used,
-                error=final_error
-            )
-            
-        except ValueError:
-            # If fails, use standard method
-            return self._solve_standard_formula(equation)
+    def _solve_catalan_method(self, equation: QuadraticEquation, A: float) -> Solution:
+        """Solve using Catalan numbers method
+
+        Args:
+            equation: Equation to be solved
+            A: Parameter ac/b², already computed and checked against the
+                threshold by the caller
+        """
+        # Approximate by Catalan series
+        u_series, terms_used, final_error = self._compute_catalan_series(A)
+
+        # Convert back to x: x = -(c/b) * u
+        x1 = -(equation.c / equation.b) * u_series
+
+        # Second root by Vieta's relation: x₁*x₂ = c/a
+        x2 = equation.c / (equation.a * x1)
+
+        return Solution(
+            roots=(x1, x2),
+            method_used="Catalan series",
+            terms_used=terms_used,
+            error=final_error
+        )
     
     def solve(self, equation: QuadraticEquation, verbose: bool = False) -> Solution:
         """
@@ -208,51 +313,188 @@ class CatalanSolver:
             verbose: If True, prints process details
             
         Returns:
-            Solution object with roots and metadata
+            Solution object with roots and metadata. Results are memoized
+            per solver on the coefficient triple, so repeated solves of the
+            same equation (parameter sweeps, test suites) skip the work
         """
         if verbose:
             print(f"Solving: {equation}")
             print("-" * 50)
-        
+
+        key = (equation.a, equation.b, equation.c)
+        cached = self._cache.get(key)
+        if cached is not None:
+            if verbose:
+                self._print_solution_details(equation, cached)
+            return cached
+
         # Case 1: Linear equation (a ≈ 0)
         if self._is_zero(equation.a):
             solution = self._solve_linear(equation)
-        
+
         # Case 2: c ≈ 0 (one root is zero)
         elif self._is_zero(equation.c):
             solution = self._solve_missing_c(equation)
-        
+
         # Case 3: b ≈ 0 (no linear term)
         elif self._is_zero(equation.b):
             solution = self._solve_missing_b(equation)
-        
+
         # Case 4: Complete quadratic equation
         else:
-            A = self._compute_catalan_parameter(equation)
-            
+            # Compute b², ac and A once; both branches reuse them
+            b2 = equation.b * equation.b
+            ac = equation.a * equation.c
+            A = ac / b2
+
             if abs(A) <= self.CATALAN_THRESHOLD:
-                solution = self._solve_catalan_method(equation)
+                solution = self._solve_catalan_method(equation, A)
             else:
-                solution = self._solve_standard_formula(equation)
-        
+                solution = self._solve_standard_formula(equation, b2 - 4 * ac)
+
+        self._cache[key] = solution
+
         if verbose:
             self._print_solution_details(equation, solution)
         
         return solution
     
+    def solve_batch(self, a: np.ndarray, b: np.ndarray,
+                    c: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve many quadratic equations at once using vectorized NumPy ops
+
+        Coefficients are given structure-of-arrays style: three parallel
+        float64 arrays instead of one QuadraticEquation per row, so the
+        per-equation Python dispatch of solve() is amortized over the whole
+        batch. Rows with |A| <= 1/4 are solved with the Catalan series
+        (evaluated vectorwise across those rows), the rest with the
+        standard quadratic formula.
+
+        Intended for genuinely quadratic equations: rows with a = 0 are not
+        routed to the linear solver — they come back as all-NaN with the
+        method labeled "Unsupported (a=0)". Use solve() for those.
+
+        Args:
+            a: Coefficients of x² (array-like)
+            b: Coefficients of x (array-like)
+            c: Constant terms (array-like)
+
+        Returns:
+            Tuple (roots, methods) where roots has shape (n, 2) with NaN
+            for missing real roots, and methods holds the method label
+            used for each row
+        """
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        c = np.asarray(c, dtype=np.float64)
+
+        roots = np.full((a.shape[0], 2), np.nan)
+        methods = np.full(a.shape[0], "Quadratic formula", dtype=object)
+
+        # Parameter A = ac/b² decides the method per row
+        with np.errstate(divide='ignore', invalid='ignore'):
+            A = (a * c) / (b * b)
+        catalan_mask = (np.isfinite(A) &
+                        (np.abs(A) <= self.CATALAN_THRESHOLD) &
+                        (a != 0) & (c != 0))
+
+        # Degenerate rows (a = 0) are excluded from both vectorized paths:
+        # dividing by 2a would turn them into infinities under the standard
+        # formula's label, so they stay all-NaN with an explicit marker
+        degenerate_mask = (a == 0)
+        methods[degenerate_mask] = "Unsupported (a=0)"
+
+        # Standard-formula rows: one vectorized pass over the whole batch
+        standard_mask = ~catalan_mask & ~degenerate_mask
+        if np.any(standard_mask):
+            disc = b * b - 4 * a * c
+            real_mask = standard_mask & (disc >= 0)
+            sqrt_disc = np.sqrt(np.where(disc >= 0, disc, 0.0))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                roots[:, 0] = np.where(real_mask, (-b + sqrt_disc) / (2 * a),
+                                       roots[:, 0])
+                roots[:, 1] = np.where(real_mask, (-b - sqrt_disc) / (2 * a),
+                                       roots[:, 1])
+            methods[standard_mask & (disc < 0)] = "No real solutions"
+
+        # Catalan rows: same method switch as the scalar kernel, made
+        # vectorwise — Newton near the convergence boundary, the series
+        # elsewhere. Boundary rows are kept out of the series pass so its
+        # early-exit test only waits on rows that keep the series result
+        # (a |A| = 1/4 row would otherwise never satisfy it).
+        if np.any(catalan_mask):
+            A_cat = A[catalan_mask]
+            u = np.empty_like(A_cat)
+            newton_mask = np.abs(A_cat) > 0.1
+            series_mask = ~newton_mask
+
+            if np.any(series_mask):
+                A_ser = A_cat[series_mask]
+                u_ser = np.zeros_like(A_ser)
+                a_pow = np.ones_like(A_ser)
+                catalan = 1.0
+                # The geometric-tail factor 1 - 4|A| is at least 0.6 on
+                # these rows; the floor just pins the threshold positive
+                term_threshold = self.tolerance * np.maximum(
+                    1.0 - 4.0 * np.abs(A_ser), 0.5)
+
+                for n in range(self.MAX_TERMS):
+                    term = catalan * a_pow
+                    u_ser += term
+                    # Early exit once every row has converged
+                    if np.all(np.abs(term) < term_threshold):
+                        break
+                    a_pow *= A_ser
+                    catalan = catalan * (4.0 * n + 2.0) / (n + 2.0)
+
+                u[series_mask] = u_ser
+
+            if np.any(newton_mask):
+                A_newton = A_cat[newton_mask]
+                u_newton = 1.0 + A_newton
+                for _ in range(self.MAX_TERMS):
+                    denominator = 1.0 - 2.0 * A_newton * u_newton
+                    # Freeze rows whose tangent is flat — the vector form
+                    # of the scalar kernel's denominator == 0 break; at
+                    # A = 1/4 exactly the iterate lands on the double root
+                    # u = 2, where the denominator vanishes
+                    active = denominator != 0.0
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        u_next = np.where(
+                            active,
+                            (1.0 - A_newton * u_newton * u_newton) /
+                            denominator,
+                            u_newton)
+                    converged = np.all(np.abs(u_next - u_newton) <
+                                       self.tolerance)
+                    u_newton = u_next
+                    if converged:
+                        break
+                u[newton_mask] = u_newton
+
+            b_cat = b[catalan_mask]
+            c_cat = c[catalan_mask]
+            x1 = -(c_cat / b_cat) * u
+            x2 = c_cat / (a[catalan_mask] * x1)
+            roots[catalan_mask, 0] = x1
+            roots[catalan_mask, 1] = x2
+            methods[catalan_mask] = "Catalan series"
+
+        return roots, methods
+
     def _print_solution_details(self, equation: QuadraticEquation, solution: Solution):
         """Print details of the found solution"""
         print(f"Method used: {solution.method_used}")
         
         if solution.roots:
             print(f"Roots found: {len(solution.roots)}")
+            a, b, c = equation.a, equation.b, equation.c
             for i, root in enumerate(solution.roots, 1):
                 print(f"  x{i} = {root:.8f}")
-                
-                # Solution verification
-                verification = (equation.a * root**2 + 
-                              equation.b * root + 
-                              equation.c)
+
+                # Solution verification, Horner form: one multiply-add chain
+                verification = (a * root + b) * root + c
                 print(f"       Verification: {verification:.2e}")
         else:
             print("No real roots found")
@@ -264,6 +506,10 @@ class CatalanSolver:
             print(f"Approximation error: {solution.error:.2e}")
 
 
+# Public precomputed table: C(0) .. C(MAX_TERMS), one tuple subscript per use
+CATALAN_NUMBERS: Tuple[int, ...] = _precompute_catalan(CatalanSolver.MAX_TERMS + 1)
+
+
 def demonstrate_solver():
     """Demonstrate the solver usage with different examples"""
     print("QUADRATIC EQUATION SOLVER DEMONSTRATION")
@@ -1,13 +1,13 @@
 import math
 
 def catalan_number(n):
-    """Calcula o n-ésimo número de Catalan"""
+    """Calcula o n-ésimo número de Catalan via C(k+1) = C(k)*(4k+2)//(k+2)"""
     if n == 0:
         return 1
     result = 1
-    for i in range(n):
-        result = result * (2 * n - i) // (i + 1)
-    return result // (n + 1)
+    for k in range(n):
+        result = result * (4 * k + 2) // (k + 2)
+    return result
 
 def demo_catalan_method():
     """
@@ -46,10 +46,12 @@ def demo_catalan_method():
     
     u_series = 0
     tolerance = 1e-10
-    
+
+    # Recorrências incrementais: C(n+1) = C(n)·2(2n+1)/(n+2) e A^(n+1) = A^n·A,
+    # O(1) por termo em vez de recalcular catalan_number(n) e A**n do zero
+    catalan_n = 1
+    a_power_n = 1.0
     for n in range(15):  # Máximo 15 termos
-        catalan_n = catalan_number(n)
-        a_power_n = A ** n
         term = catalan_n * a_power_n
         u_series += term
         
@@ -60,6 +62,9 @@ def demo_catalan_method():
         if error < tolerance:
             print(f"\nConvergiu com {n+1} termos!")
             break
+
+        catalan_n = catalan_n * (4 * n + 2) // (n + 2)
+        a_power_n *= A
     
     # Passo 4: Converter de volta para x
     # Da transformação u = -(b/c)x, temos x = -(c/b)u
@@ -12,6 +12,8 @@ import pytest
 import math
 from typing import List
 
+import numpy as np
+
 from quadratic_catalan_solver import CatalanSolver, QuadraticEquation
 
 # Classes are already imported above, keeping this comment for reference
@@ -166,6 +168,16 @@ class TestCatalanSolver:
         
         assert len(solution.roots) == 0
     
+    def test_solve_cache(self, solver):
+        """Test that repeated solves of the same coefficients are memoized"""
+        eq = QuadraticEquation(1, 4, 1)
+
+        first = solver.solve(eq)
+        second = solver.solve(QuadraticEquation(1, 4, 1))
+
+        # Cache hit returns the stored Solution without re-solving
+        assert second is first
+
     def _quadratic_formula(self, a: float, b: float, c: float) -> List[float]:
         """Helper method to calculate roots using quadratic formula"""
         discriminant = b**2 - 4*a*c
@@ -180,44 +192,113 @@ class TestCatalanSolver:
         return [root1, root2]
 
 
+class TestBatchSolving:
+    """Test the vectorized batch API"""
+
+    def test_batch_matches_scalar_solver(self):
+        """Test that batch roots agree with per-equation solve()"""
+        solver = CatalanSolver()
+
+        a = np.array([1.0, 2.0, 1.0, 1.0])
+        b = np.array([4.0, 6.0, -5.0, 0.0])
+        c = np.array([1.0, 1.0, 6.0, -4.0])
+
+        roots, methods = solver.solve_batch(a, b, c)
+
+        assert roots.shape == (4, 2)
+        for i in range(len(a)):
+            scalar = solver.solve(QuadraticEquation(a[i], b[i], c[i]))
+            for batch_root in roots[i]:
+                assert any(abs(batch_root - expected) < 1e-8
+                           for expected in scalar.roots)
+
+    def test_batch_method_dispatch(self):
+        """Test that each row is labeled with the method actually used"""
+        solver = CatalanSolver()
+
+        # A = 1/16 (Catalan), A = 0.5 (standard, complex), A = 6 (standard),
+        # a = 0 (degenerate, unsupported in batch)
+        a = np.array([1.0, 1.0, 1.0, 0.0])
+        b = np.array([4.0, 2.0, 1.0, 3.0])
+        c = np.array([1.0, 2.0, -6.0, 9.0])
+
+        roots, methods = solver.solve_batch(a, b, c)
+
+        assert methods[0] == "Catalan series"
+        assert methods[1] == "No real solutions"
+        assert methods[2] == "Quadratic formula"
+        assert methods[3] == "Unsupported (a=0)"
+
+        # Complex pair comes back as NaN
+        assert np.all(np.isnan(roots[1]))
+
+        # Degenerate row stays all-NaN instead of dividing by 2a = 0
+        assert np.all(np.isnan(roots[3]))
+
+    def test_batch_boundary_double_root(self):
+        """Test the A = 1/4 boundary: x² + 2x + 1 has the double root -1"""
+        solver = CatalanSolver()
+
+        roots, methods = solver.solve_batch([1.0], [2.0], [1.0])
+
+        assert methods[0] == "Catalan series"
+        np.testing.assert_allclose(roots[0], [-1.0, -1.0], atol=1e-8)
+
+        # Batch and scalar paths must agree at the boundary
+        scalar = solver.solve(QuadraticEquation(1, 2, 1))
+        np.testing.assert_allclose(sorted(roots[0]), sorted(scalar.roots),
+                                   atol=1e-8)
+
+    def test_batch_roots_satisfy_equations(self):
+        """Test residuals of the batch roots against the original equations"""
+        solver = CatalanSolver()
+
+        a = np.array([1.0, 2.0, 3.0, 1.0])
+        b = np.array([8.0, -7.0, 12.0, 6.0])
+        c = np.array([1.0, 3.0, 2.0, 1.0])
+
+        roots, _ = solver.solve_batch(a, b, c)
+        residuals = (a[:, None] * roots**2 + b[:, None] * roots + c[:, None])
+
+        np.testing.assert_allclose(residuals, 0, atol=1e-8)
+
+
 class TestIntegration:
     """Integration tests for the complete system"""
     
     def test_solution_verification(self):
         """Test if found solutions actually satisfy the equation"""
         solver = CatalanSolver()
-        test_cases = [
-            QuadraticEquation(1, 4, 1),    # Catalan case
-            QuadraticEquation(2, -7, 3),   # Standard case
-            QuadraticEquation(1, 0, -9),   # b = 0
-            QuadraticEquation(3, 12, 0),   # c = 0
-        ]
-        
-        for eq in test_cases:
-            solution = solver.solve(eq)
-            
-            for root in solution.roots:
-                # Substitute in original equation
-                result = eq.a * root**2 + eq.b * root + eq.c
-                
-                # Check if result is close to zero
-                assert abs(result) < 1e-8, f"Root {root} doesn't satisfy {eq}"
-    
+
+        # SoA coefficient arrays: Catalan case, standard case, b = 0, c = 0
+        a = np.array([1.0, 2.0, 1.0, 3.0])
+        b = np.array([4.0, -7.0, 0.0, 12.0])
+        c = np.array([1.0, 3.0, -9.0, 0.0])
+
+        roots, _ = solver.solve_batch(a, b, c)
+
+        # Substitute all roots in their equations with one vectorized pass
+        residuals = a[:, None] * roots**2 + b[:, None] * roots + c[:, None]
+        np.testing.assert_allclose(residuals, 0, atol=1e-8)
+
     def test_catalan_convergence_properties(self):
         """Test convergence properties of Catalan series"""
         solver = CatalanSolver(tolerance=1e-12)
-        
+
         # Cases with different A values
-        test_equations = [
-            QuadraticEquation(1, 8, 1),     # A = 1/64 ≈ 0.0156
-            QuadraticEquation(1, 4, 1),     # A = 1/16 = 0.0625  
-            QuadraticEquation(4, 8, 1),     # A = 1/16 = 0.0625
-            QuadraticEquation(1, 2, 0.24),  # A ≈ 0.24 (close to limit)
-        ]
-        
-        for eq in test_equations:
-            A = (eq.a * eq.c) / (eq.b**2)
-            
+        coefficients = np.array([
+            [1, 8, 1],     # A = 1/64 ≈ 0.0156
+            [1, 4, 1],     # A = 1/16 = 0.0625
+            [4, 8, 1],     # A = 1/16 = 0.0625
+            [1, 2, 0.24],  # A = 0.06 (smaller b, closer to limit)
+        ])
+
+        # Whole A vector in one expression instead of one division per row
+        A_values = (coefficients[:, 0] * coefficients[:, 2]) / coefficients[:, 1]**2
+
+        for (a, b, c), A in zip(coefficients, A_values):
+            eq = QuadraticEquation(a, b, c)
+
             if abs(A) <= 0.25:
                 solution = solver.solve(eq)
                 
@@ -289,15 +370,19 @@ def run_all_tests():
     # List of test classes
     test_classes = [
         TestCatalanNumber,
-        TestQuadraticEquation, 
+        TestQuadraticEquation,
         TestCatalanSolver,
+        TestBatchSolving,
         TestIntegration,
         TestEdgeCases
     ]
     
     total_tests = 0
     passed_tests = 0
-    
+
+    # One shared solver: repeated equations across tests hit the solve cache
+    shared_solver = CatalanSolver()
+
     for test_class in test_classes:
         print(f"\n{test_class.__name__}:")
         print("-" * 30)
@@ -318,7 +403,7 @@ def run_all_tests():
                 
                 # Inject dependencies if needed
                 if hasattr(test_instance, 'solver') and method_name != 'solver':
-                    test_method(CatalanSolver())
+                    test_method(shared_solver)
                 else:
                     test_method()
                 
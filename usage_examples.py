@@ -6,13 +6,51 @@ This file demonstrates how to use the quadratic equation solver
 with Catalan numbers efficiently and following best practices.
 """
 
+import importlib.util
+import os
 import sys
+from functools import lru_cache
 from typing import List
-import matplotlib.pyplot as plt
+
 import numpy as np
+from numpy.polynomial.polynomial import polyval
 
 # Import classes from main module
-from quadratic_catalan_solver import QuadraticEquation, CatalanSolver, Solution
+from quadratic_catalan_solver import (QuadraticEquation, CatalanSolver,
+                                      Solution, CATALAN_NUMBERS,
+                                      _catalan_series_kernel)
+
+
+def _select_plot_backend():
+    """Pick the Agg backend on headless systems before pyplot loads
+
+    Skips GUI event-loop initialization (~hundreds of ms cold) and the
+    'no display' warnings when the examples run non-interactively.
+    """
+    if not os.environ.get("DISPLAY") and sys.platform != "darwin":
+        import matplotlib
+        matplotlib.use("Agg")
+
+
+def _fmt_roots(roots):
+    """Format a root collection with 6 decimal places, one shared code path"""
+    return np.array2string(np.asarray(roots, dtype=np.float64),
+                           formatter={'float_kind': lambda x: f"{x:.6f}"},
+                           separator=', ')
+
+
+@lru_cache(maxsize=32)
+def _parabola_points(a, b, c, lo, hi, n):
+    """Sample n points of ax² + bx + c over [lo, hi]
+
+    Memoized on the argument tuple so repeated visualizations of the same
+    equation (notebook re-runs, parameter sweeps) reuse the arrays.
+    The returned arrays are shared — treat them as read-only.
+    """
+    x = np.linspace(lo, hi, n, dtype=np.float32)
+    # polyval streams a fused Horner pass in C, with no Python-level
+    # temporaries for the intermediate products
+    return x, polyval(x, np.array([c, b, a], dtype=x.dtype))
 
 
 def basic_usage_example():
@@ -30,7 +68,7 @@ def basic_usage_example():
     # Access results
     if solution.roots:
         print(f"Number of roots: {len(solution.roots)}")
-        print(f"Roots: {solution.roots}")
+        print(f"Roots: {_fmt_roots(solution.roots)}")
         print(f"Method used: {solution.method_used}")
         
         if solution.terms_used:
@@ -43,38 +81,60 @@ def batch_solving_example():
     print("-" * 35)
     
     solver = CatalanSolver(tolerance=1e-12)
-    
-    # List of equations to solve
-    equations = [
-        ("x² + 4x + 1 = 0", QuadraticEquation(1, 4, 1)),
-        ("2x² + 6x + 1 = 0", QuadraticEquation(2, 6, 1)),
-        ("x² + 2x + 2 = 0", QuadraticEquation(1, 2, 2)),
-        ("x² - 5x + 6 = 0", QuadraticEquation(1, -5, 6)),
-        ("3x + 9 = 0", QuadraticEquation(0, 3, 9)),
+
+    # Quadratic equations packed structure-of-arrays style: one coefficient
+    # array per position instead of one QuadraticEquation object per row
+    descriptions = [
+        "x² + 4x + 1 = 0",
+        "2x² + 6x + 1 = 0",
+        "x² + 2x + 2 = 0",
+        "x² - 5x + 6 = 0",
     ]
-    
+    a = np.array([1.0, 2.0, 1.0, 1.0])
+    b = np.array([4.0, 6.0, 2.0, -5.0])
+    c = np.array([1.0, 1.0, 2.0, 6.0])
+
+    # One vectorized pass over the whole batch
+    roots, methods = solver.solve_batch(a, b, c)
+
     results = []
-    
-    for description, eq in equations:
-        print(f"\nSolving: {description}")
-        solution = solver.solve(eq)
-        
+    # Output is accumulated and printed once: a print per equation would
+    # flush line-buffered stdout on every row, which dominates the
+    # example's wall-clock on slow terminals
+    lines = []
+
+    for i, description in enumerate(descriptions):
+        lines.append(f"\nSolving: {description}")
+        real_roots = roots[i][~np.isnan(roots[i])]
+
         results.append({
             'equation': description,
-            'method': solution.method_used,
-            'roots': solution.roots,
-            'terms_used': solution.terms_used
+            'method': methods[i],
+            'roots': tuple(real_roots),
         })
-        
+
         # Solution summary
-        if solution.roots:
-            roots_str = ", ".join(f"{root:.6f}" for root in solution.roots)
-            print(f"  Roots: {roots_str}")
+        if real_roots.size:
+            lines.append(f"  Roots: {_fmt_roots(real_roots)}")
         else:
-            print("  No real roots")
-        
-        print(f"  Method: {solution.method_used}")
-    
+            lines.append("  No real roots")
+
+        lines.append(f"  Method: {methods[i]}")
+
+    # Degenerate rows (a = 0) stay on the scalar path
+    description = "3x + 9 = 0"
+    solution = solver.solve(QuadraticEquation(0, 3, 9))
+    lines.append(f"\nSolving: {description}")
+    lines.append(f"  Roots: {_fmt_roots(solution.roots)}")
+    lines.append(f"  Method: {solution.method_used}")
+
+    results.append({
+        'equation': description,
+        'method': solution.method_used,
+        'roots': solution.roots,
+    })
+
+    print("\n".join(lines))
     return results
 
 
@@ -86,22 +146,26 @@ def convergence_analysis_example():
     # Different tolerances for comparison
     tolerances = [1e-4, 1e-8, 1e-12]
     equation = QuadraticEquation(1, 6, 1)  # A = 1/36 ≈ 0.028
-    
+    A = (equation.a * equation.c) / (equation.b ** 2)
+
     print(f"Equation: {equation}")
-    print(f"A = ac/b² = {(equation.a * equation.c) / (equation.b**2):.6f}")
+    print(f"A = ac/b² = {A:.6f}")
     print()
-    
+
+    # Call the solver's series kernel directly (JIT-compiled when Numba is
+    # installed): same loop solve() runs, minus the per-call dispatch and
+    # Solution construction — ideal for a tolerance sweep like this one
     for tol in tolerances:
-        solver = CatalanSolver(tolerance=tol)
-        solution = solver.solve(equation)
-        
-        if solution.method_used == "Catalan series":
-            print(f"Tolerance: {tol:.0e}")
-            print(f"  Terms used: {solution.terms_used}")
-            print(f"  Final error: {solution.error:.2e}")
-            print(f"  Main root: {solution.roots[0]:.10f}")
-        else:
-            print(f"Tolerance {tol}: Standard method used")
+        u_series, terms_used, residual = _catalan_series_kernel(
+            A, tol, CatalanSolver.MAX_TERMS)
+
+        # Convert back to x exactly as the solver does: x = -(c/b) * u
+        main_root = -(equation.c / equation.b) * u_series
+
+        print(f"Tolerance: {tol:.0e}")
+        print(f"  Terms used: {terms_used}")
+        print(f"  Final error: {residual:.2e}")
+        print(f"  Main root: {main_root:.10f}")
 
 
 def performance_comparison_example():
@@ -110,29 +174,50 @@ def performance_comparison_example():
     print("-" * 42)
     
     import time
-    
-    # Equations favorable to Catalan method
-    catalan_favorable = [
-        QuadraticEquation(1, 8, 1),    # A = 1/64
-        QuadraticEquation(1, 6, 1),    # A = 1/36
-        QuadraticEquation(2, 10, 1),   # A = 1/50
-        QuadraticEquation(1, 4, 0.5),  # A = 1/32
-    ]
-    
+
+    # Coefficients built once, structure-of-arrays style; all favorable
+    # to the Catalan method (A = 1/64, 1/36, 1/50, 1/32)
+    a_arr = np.array([1.0, 1.0, 2.0, 1.0])
+    b_arr = np.array([8.0, 6.0, 10.0, 4.0])
+    c_arr = np.array([1.0, 1.0, 1.0, 0.5])
+
+    catalan_favorable = tuple(QuadraticEquation(a, b, c)
+                              for a, b, c in zip(a_arr, b_arr, c_arr))
+
     solver_catalan = CatalanSolver()
     num_iterations = 1000
-    
+
     print(f"Solving {len(catalan_favorable)} equations {num_iterations} times each...")
-    
-    # Test with Catalan method
-    start_time = time.time()
+
+    # Scalar solver: one solve() call per equation. The memoization cache
+    # is cleared at the top of every lap so each lap recomputes the series
+    # rather than replaying dict hits — otherwise the comparison below
+    # would time cache lookups against real vectorized work. The bound
+    # methods are hoisted so the hot loop does LOAD_FAST calls, and
+    # perf_counter_ns gives nanosecond timer resolution everywhere
+    solve = solver_catalan.solve
+    clear_cache = solver_catalan._cache.clear
+    start_time = time.perf_counter_ns()
     for _ in range(num_iterations):
+        clear_cache()
         for eq in catalan_favorable:
-            solution = solver_catalan.solve(eq)
-    catalan_time = time.time() - start_time
-    
+            solution = solve(eq)
+    catalan_time = (time.perf_counter_ns() - start_time) / 1e9
+
+    # Vectorized formula: one width-4 NumPy computation per iteration,
+    # stable citardauq form as in the solver
+    start_time = time.perf_counter_ns()
+    for _ in range(num_iterations):
+        disc = b_arr * b_arr - 4 * a_arr * c_arr
+        q = -0.5 * (b_arr + np.copysign(np.sqrt(disc), b_arr))
+        roots_1 = q / a_arr
+        roots_2 = c_arr / q
+    vectorized_time = (time.perf_counter_ns() - start_time) / 1e9
+
     print(f"Catalan method time: {catalan_time:.4f}s")
     print(f"Average time per equation: {(catalan_time / (len(catalan_favorable) * num_iterations) * 1000):.2f}ms")
+    print(f"Vectorized formula time: {vectorized_time:.4f}s")
+    print(f"Vectorized speedup: {catalan_time / vectorized_time:.1f}x")
 
 
 def error_handling_example():
@@ -141,7 +226,8 @@ def error_handling_example():
     print("-" * 45)
     
     solver = CatalanSolver()
-    
+    solve = solver.solve  # bound once; each call below is a LOAD_FAST
+
     # Special cases
     special_cases = [
         ("Impossible equation", QuadraticEquation(0, 0, 5)),
@@ -155,10 +241,10 @@ def error_handling_example():
         print(f"\n{description}: {eq}")
         
         try:
-            solution = solver.solve(eq)
-            
+            solution = solve(eq)
+
             if solution.roots:
-                print(f"  Roots: {[f'{r:.6f}' for r in solution.roots]}")
+                print(f"  Roots: {_fmt_roots(solution.roots)}")
             else:
                 print(f"  Result: {solution.method_used}")
                 
@@ -170,6 +256,11 @@ def visualization_example():
     """Example of results visualization"""
     print("\nEXAMPLE 6: Results Visualization")
     print("-" * 40)
+
+    # Imported here so the numeric examples never pay matplotlib's
+    # cold-import cost (hundreds of ms)
+    _select_plot_backend()
+    import matplotlib.pyplot as plt
     
     # Equation to visualize: x² + 4x + 1 = 0
     eq = QuadraticEquation(1, 4, 1)
@@ -180,87 +271,99 @@ def visualization_example():
         print("No real roots to visualize.")
         return
     
-    # Prepare data for plot
-    x_vals = np.linspace(-6, 2, 1000)
-    y_vals = eq.a * x_vals**2 + eq.b * x_vals + eq.c
-    
-    # Create plot
-    plt.figure(figsize=(10, 6))
+    # Prepare data for plot (cached across repeated calls for the same
+    # equation and window)
+    x_vals, y_vals = _parabola_points(eq.a, eq.b, eq.c, -6.0, 2.0, 400)
     
+    # Create plot; constrained_layout solves the layout during draw, so
+    # no separate tight_layout pass over the artists is needed
+    fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
+
     # Plot parabola
-    plt.plot(x_vals, y_vals, 'b-', linewidth=2, label=f'{eq.a}x² + {eq.b}x + {eq.c}')
-    
+    ax.plot(x_vals, y_vals, 'b-', linewidth=2, label=f'{eq.a}x² + {eq.b}x + {eq.c}')
+
     # Mark roots
     for i, root in enumerate(solution.roots):
-        plt.plot(root, 0, 'ro', markersize=8, label=f'x_{i+1} = {root:.4f}')
-    
+        ax.plot(root, 0, 'ro', markersize=8, label=f'x_{i+1} = {root:.4f}')
+
     # Mark axes
-    plt.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-    plt.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-    
+    ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+    ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+
     # Configure plot
-    plt.grid(True, alpha=0.3)
-    plt.xlabel('x')
-    plt.ylabel('f(x)')
-    plt.title(f'Plot of equation {eq}\nMethod used: {solution.method_used}')
-    plt.legend()
-    
-    # Adjust y-axis limits
-    y_min, y_max = min(y_vals), max(y_vals)
+    ax.grid(True, alpha=0.3)
+    ax.set_xlabel('x')
+    ax.set_ylabel('f(x)')
+    ax.set_title(f'Plot of equation {eq}\nMethod used: {solution.method_used}')
+    ax.legend()
+
+    # Adjust y-axis limits: ndarray reductions, not Python's element-wise
+    # min/max built-ins
+    y_min, y_max = y_vals.min(), y_vals.max()
     margin = (y_max - y_min) * 0.1
-    plt.ylim(y_min - margin, y_max + margin)
-    
-    plt.tight_layout()
-    
+    ax.set_ylim(y_min - margin, y_max + margin)
+
     # Save or show
     try:
-        plt.savefig('quadratic_equation_plot.png', dpi=300, bbox_inches='tight')
+        fig.savefig('quadratic_equation_plot.png', dpi=300, bbox_inches='tight')
         print("Plot saved as 'quadratic_equation_plot.png'")
     except:
         print("Could not save plot")
-    
+
     plt.show()
+    plt.close(fig)  # release the figure's memory promptly
 
 
 def catalan_series_visualization():
     """Visualize Catalan series convergence"""
     print("\nEXAMPLE 7: Catalan Convergence Visualization")
     print("-" * 52)
+
+    # Imported here so the numeric examples never pay matplotlib's
+    # cold-import cost (hundreds of ms)
+    _select_plot_backend()
+    import matplotlib.pyplot as plt
     
     # Parameters for equation x² + 4x + 1 = 0
     A = 1/16  # ac/b² = (1*1)/(4²)
-    solver = CatalanSolver()
-    
-    # Calculate series terms
-    terms = []
-    partial_sums = []
-    catalan_numbers = []
-    
-    partial_sum = 0
-    for n in range(15):
-        catalan_n = solver.catalan_number(n)
-        term = catalan_n * (A ** n)
-        partial_sum += term
-        
-        terms.append(term)
-        partial_sums.append(partial_sum)
-        catalan_numbers.append(catalan_n)
-    
+    N = 15
+    n_arr = np.arange(N)
+
+    # The series data only depends on (A, N), so repeated runs (docs
+    # builds, notebook re-executions) load the arrays from a local .npz
+    # instead of recomputing them
+    cache_path = f".cache_catalan_A{A:.6f}_N{N}.npz"
+    if os.path.exists(cache_path):
+        cached = np.load(cache_path)
+        catalan_numbers = cached['catalan_numbers']
+        terms = cached['terms']
+        partial_sums = cached['partial_sums']
+    else:
+        # Calculate series terms in one vectorized shot: C(n) * A^n for
+        # all n, with the running sums as a single cumulative reduction
+        catalan_numbers = np.asarray(CATALAN_NUMBERS[:N], dtype=np.float64)
+        terms = catalan_numbers * np.power(A, n_arr)
+        partial_sums = np.cumsum(terms)
+        np.savez(cache_path, catalan_numbers=catalan_numbers,
+                 terms=terms, partial_sums=partial_sums)
+
     # Exact solution for comparison
     u_exact = (1 - np.sqrt(1 - 4*A)) / (2*A)
+    errors = np.abs(partial_sums - u_exact)
     
-    # Create plots
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
+    # Create plots; constrained_layout replaces the final tight_layout pass
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10),
+                                                 constrained_layout=True)
     
     # Plot 1: Catalan numbers
-    ax1.bar(range(len(catalan_numbers)), catalan_numbers, alpha=0.7, color='skyblue')
+    ax1.bar(n_arr, catalan_numbers, alpha=0.7, color='skyblue')
     ax1.set_xlabel('n')
     ax1.set_ylabel('C(n)')
     ax1.set_title('Catalan Numbers')
     ax1.set_yscale('log')
     
     # Plot 2: Series terms
-    ax2.bar(range(len(terms)), terms, alpha=0.7, color='lightgreen')
+    ax2.bar(n_arr, terms, alpha=0.7, color='lightgreen')
     ax2.set_xlabel('n')
     ax2.set_ylabel('C(n) × A^n')
     ax2.set_title('Series Terms')
@@ -276,29 +379,27 @@ def catalan_series_visualization():
     ax3.grid(True, alpha=0.3)
     
     # Plot 4: Approximation error
-    errors = [abs(ps - u_exact) for ps in partial_sums]
     ax4.semilogy(errors, 'ro-', markersize=4)
     ax4.set_xlabel('Number of terms')
     ax4.set_ylabel('Absolute error')
     ax4.set_title('Approximation Error')
     ax4.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    
+
     try:
-        plt.savefig('catalan_convergence.png', dpi=300, bbox_inches='tight')
+        fig.savefig('catalan_convergence.png', dpi=300, bbox_inches='tight')
         print("Convergence plot saved as 'catalan_convergence.png'")
     except:
         print("Could not save plot")
-    
+
     plt.show()
+    plt.close(fig)  # release the figure's memory promptly
     
     # Show data numerically
     print("\nConvergence Data:")
     print("n  | C(n) | Term     | Sum      | Error")
     print("-" * 40)
     for i in range(min(10, len(terms))):
-        print(f"{i:2d} | {catalan_numbers[i]:4d} | {terms[i]:.6f} | {partial_sums[i]:.6f} | {errors[i]:.2e}")
+        print(f"{i:2d} | {int(catalan_numbers[i]):4d} | {terms[i]:.6f} | {partial_sums[i]:.6f} | {errors[i]:.2e}")
 
 
 def advanced_analysis_example():
@@ -307,7 +408,8 @@ def advanced_analysis_example():
     print("-" * 40)
     
     solver = CatalanSolver()
-    
+    solve = solver.solve  # bound once; each call below is a LOAD_FAST
+
     # Analyze how A parameter affects convergence
     test_equations = [
         (QuadraticEquation(1, 16, 1), "A = 1/256 ≈ 0.004"),
@@ -320,10 +422,13 @@ def advanced_analysis_example():
     print("Analysis of convergence vs. parameter A:")
     print("Equation               | A value | Terms | Error     | Method")
     print("-" * 65)
-    
-    for eq, description in test_equations:
-        A = (eq.a * eq.c) / (eq.b**2)
-        solution = solver.solve(eq)
+
+    # SoA layout: the whole A column comes from one vectorized expression
+    coefficients = np.array([[eq.a, eq.b, eq.c] for eq, _ in test_equations])
+    A_values = (coefficients[:, 0] * coefficients[:, 2]) / coefficients[:, 1]**2
+
+    for (eq, description), A in zip(test_equations, A_values):
+        solution = solve(eq)
         
         method_short = "Catalan" if solution.method_used == "Catalan series" else "Standard"
         terms_str = str(solution.terms_used) if solution.terms_used else "N/A"
@@ -355,7 +460,8 @@ def educational_example():
     print("n | C(n) | Context")
     print("-" * 40)
     for n in range(5):
-        cn = solver.catalan_number(n)
+        # Compile-time constants: straight out of the precomputed table
+        cn = CATALAN_NUMBERS[n]
         context = contexts[n] if n < len(contexts) else ("More applications...", "")
         print(f"{n} | {cn:4d} | {context[0]}")
     
@@ -396,17 +502,13 @@ def main():
         educational_example()
         
         # Examples with visualization (require matplotlib)
-        try:
-            import matplotlib.pyplot as plt
-            import numpy as np
-            
+        if importlib.util.find_spec("matplotlib") is not None:
             print("\nRunning visualization examples...")
             visualization_example()
             catalan_series_visualization()
-            
-        except ImportError:
+        else:
             print("\nNote: matplotlib not available. Skipping visualization examples.")
-            print("To see plots, install: pip install matplotlib numpy")
+            print("To see plots, install: pip install matplotlib")
         
     except Exception as e:
         print(f"Error during execution: {e}")